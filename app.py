@@ -0,0 +1,146 @@
+"""
+Paperbird web application.
+
+This FastAPI app serves the landing page and the paper-search API. A search
+fetches recent papers from arXiv, runs each one through the AIInspector
+concurrently, and returns the relevant papers with tailored summaries.
+"""
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from pydantic import BaseModel
+
+from src.ai_inspector import AIInspector
+from src.arxiv_fetcher import ArxivFetcher
+
+logger = logging.getLogger(__name__)
+
+# orjson serializes the up-to-50-paper response in C instead of stdlib json
+app = FastAPI(title="Paperbird", default_response_class=ORJSONResponse)
+
+arxiv_fetcher = ArxivFetcher()
+ai_inspector = AIInspector()
+
+# The landing page is static; read it once at import instead of per request.
+# Set PAPERBIRD_DEV=1 to re-read it on every request while editing it.
+with open("landingpage.html") as f:
+    _INDEX_HTML = f.read()
+
+
+class SearchPapersRequest(BaseModel):
+    prompt: str
+    timeframe: str = "week"
+    # date fields are parsed (and malformed input rejected) by pydantic at
+    # request deserialization, not inside the handler
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    categories: Optional[List[str]] = None
+
+
+class PaperResponse(BaseModel):
+    title: str
+    authors: List[str]
+    published: str
+    link: str
+    arxiv_id: str
+    reason: str
+    summary: Optional[str] = None
+
+
+def _build_date_query(request: SearchPapersRequest) -> str:
+    """
+    Build an arXiv submittedDate range query from the requested timeframe.
+
+    Args:
+        request: The incoming search request
+
+    Returns:
+        An arXiv query string like 'submittedDate:[202501010000 TO 202501080000]'
+    """
+    now = datetime.utcnow()
+
+    if request.timeframe == "custom" and request.start_date:
+        start = f"{request.start_date:%Y%m%d}0000"
+        end = (
+            f"{request.end_date:%Y%m%d}2359"
+            if request.end_date
+            else f"{now:%Y%m%d%H%M}"
+        )
+    else:
+        days = {"day": 1, "week": 7, "month": 30}.get(request.timeframe, 7)
+        start = f"{now - timedelta(days=days):%Y%m%d%H%M}"
+        end = f"{now:%Y%m%d%H%M}"
+
+    return f"submittedDate:[{start} TO {end}]"
+
+
+@app.get("/", response_class=HTMLResponse)
+async def get_index():
+    """Serve the landing page."""
+    if os.getenv("PAPERBIRD_DEV"):
+        with open("landingpage.html") as f:
+            return f.read()
+    return _INDEX_HTML
+
+
+@app.post("/api/search-papers")
+async def search_papers(request: SearchPapersRequest) -> Dict[str, Any]:
+    """
+    Fetch recent papers and return the ones relevant to the user's prompt.
+
+    Args:
+        request: The search request with the user's relevance prompt
+
+    Returns:
+        Dictionary with the relevant papers and the total number fetched
+    """
+    date_query = _build_date_query(request)
+    categories = request.categories or ["cs.AI", "cs.LG"]
+
+    # One cheap, cached translation call narrows the arXiv result set before
+    # any per-paper inspection happens; the cheapest inspection call is the
+    # one we never make.
+    topic_query = await ai_inspector.prompt_to_arxiv_query(request.prompt)
+    if topic_query:
+        date_query = f"({topic_query}) AND {date_query}"
+
+    fetched = await arxiv_fetcher.search_papers_async(
+        query=date_query, categories=categories, max_results=50
+    )
+    papers = fetched.to_dicts()
+
+    # Inspect the papers in batched API calls; packing several papers per
+    # request amortizes the round-trip and instruction overhead, and the
+    # chunks themselves run concurrently.
+    analyses = await ai_inspector.analyze_papers_batch(papers, request.prompt)
+
+    results = []
+    for paper, analysis in zip(papers, analyses):
+        if not analysis["is_relevant"]:
+            continue
+        results.append(
+            PaperResponse(
+                title=paper["title"],
+                authors=paper["authors"],
+                # arXiv timestamps are fixed-format ISO-8601, so the date is
+                # always the first 10 characters; no strptime needed.
+                published=paper.get("published", "")[:10],
+                link=paper["link"],
+                arxiv_id=paper["arxiv_id"],
+                reason=analysis["reason"],
+                summary=analysis["summary"],
+            )
+        )
+
+    return {"papers": results, "total_fetched": len(papers)}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=8000)
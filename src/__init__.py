@@ -4,6 +4,7 @@ Paperbird package initialization.
 This package contains modules for fetching and processing arXiv papers.
 """
 
-from .arxiv_fetcher import ArxivFetcher, format_paper_info
+from .ai_inspector import AIInspector
+from .arxiv_fetcher import ArxivFetcher, Paper, Papers, format_paper_info
 
-__all__ = ["ArxivFetcher", "format_paper_info"]
+__all__ = ["AIInspector", "ArxivFetcher", "Paper", "Papers", "format_paper_info"]
@@ -0,0 +1,492 @@
+"""
+AI Paper Inspector
+
+This module analyzes arXiv papers with the Llama API, checking each paper's
+relevance against a user's interest prompt and generating a tailored summary
+for the relevant ones.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import diskcache
+import httpx
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+# How long persisted LLM responses stay valid on disk
+_LLM_CACHE_TTL = 7 * 86400
+
+
+class PaperAnalysis(BaseModel):
+    """One paper's verdict inside a batched analysis response."""
+
+    i: int
+    is_relevant: bool
+    reason: str = ""
+    summary: str = ""
+
+
+_BATCH_ADAPTER = TypeAdapter(List[PaperAnalysis])
+
+_DECODER = json.JSONDecoder()
+
+
+def _extract_json(text: str, opening: str = "{") -> Any:
+    """
+    Parse the first JSON value embedded in free-form model output.
+
+    raw_decode stops at the true end of the value, so nested braces in the
+    model's prose or reason fields cannot truncate the payload the way the
+    old find/rfind slicing could.
+    """
+    idx = text.find(opening)
+    if idx < 0:
+        raise ValueError("No JSON payload in model response")
+    obj, _ = _DECODER.raw_decode(text, idx)
+    return obj
+
+
+# Prefill cost scales linearly with prompt tokens, so abstracts shipped to
+# the model are capped. The cap stays generous because the same call also
+# writes the summary; a standalone classifier could go far lower.
+_MAX_PROMPT_ABSTRACT_CHARS = 1500
+
+# Prompt templates are bound once at import; per-call work is a single
+# str.format instead of rebuilding the instruction text from fragments.
+_ANALYZE_PROMPT = """\
+You are screening academic papers for a product manager.
+
+USER'S INTERESTS:
+{user_prompt}
+
+PAPER INFORMATION:
+Title: {title}
+Authors: {authors}
+Categories: {categories}
+Abstract: {abstract}
+
+Decide whether this paper is relevant to the user's interests and, if it is, \
+summarize it. Respond with a JSON object of the form {{"is_relevant": true or \
+false, "reason": "short explanation", "summary": "..."}}. Set "summary" to a \
+concise 100-150 word summary tailored to the user's interests when the paper \
+is relevant, otherwise an empty string. Output the JSON object and nothing \
+else."""
+
+_BATCH_SECTION = """\
+[{i}]
+Title: {title}
+Authors: {authors}
+Categories: {categories}
+Abstract: {abstract}"""
+
+_QUERY_PROMPT = """\
+You are translating a reader's interest description into an arXiv API search \
+query.
+
+USER'S INTERESTS:
+{user_prompt}
+
+Produce a boolean arXiv query over abstract terms that narrows results to \
+papers plausibly relevant to these interests, for example \
+abs:"diffusion" AND (abs:"protein" OR abs:"folding"). Use at most six terms \
+and keep it broad enough not to miss adjacent work. Respond with a JSON \
+object of the form {{"query": "..."}} and nothing else."""
+
+_BATCH_PROMPT = """\
+You are screening academic papers for a product manager.
+
+USER'S INTERESTS:
+{user_prompt}
+
+PAPERS:
+{papers_block}
+
+For each paper decide whether it is relevant to the user's interests. Respond \
+with a JSON array containing one object per paper, of the form [{{"i": 0, \
+"is_relevant": true or false, "reason": "short explanation", "summary": \
+"..."}}]. Set "summary" to a concise 100-150 word summary tailored to the \
+user's interests when the paper is relevant, otherwise an empty string. \
+Output the JSON array and nothing else."""
+
+# Upper bound on cached analyses; at ~50 papers per search this covers many
+# repeated searches without unbounded growth.
+_CACHE_MAX_ENTRIES = 1024
+
+
+def _cache_key(stage: str, arxiv_id: str, user_prompt: str) -> str:
+    """Build the exact-match cache key for one inspection stage of one paper."""
+    return hashlib.blake2b(f"{stage}|{arxiv_id}|{user_prompt}".encode()).hexdigest()
+
+
+class AIInspector:
+    """
+    A class to analyze arXiv papers with the Llama API.
+    """
+
+    API_URL = "https://api.llama.com/v1/chat/completions"
+
+    # Model routing: summary-producing calls need the big model;
+    # classification-style calls (query translation, any standalone
+    # relevance check) run fine on the small, faster variant.
+    SUMMARY_MODEL = "Llama-4-Maverick-17B-128E-Instruct-FP8"
+    RELEVANCE_MODEL = "Llama-3-8B-Instruct"
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: float = 60.0,
+        relevance_model: Optional[str] = None,
+        summary_model: Optional[str] = None,
+    ):
+        """
+        Initialize the AIInspector.
+
+        Args:
+            api_key: Llama API key; falls back to the LLAMA_API_KEY
+                environment variable
+            timeout: Timeout in seconds for each API call
+            relevance_model: Model for classification-style calls
+            summary_model: Model for calls that generate summaries
+        """
+        self.api_key = api_key or os.getenv("LLAMA_API_KEY", "")
+        self.relevance_model = relevance_model or self.RELEVANCE_MODEL
+        self.summary_model = summary_model or self.SUMMARY_MODEL
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        # A single shared client keeps the connection pool warm across the
+        # concurrent per-paper calls issued by the web app.
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+        # Exact-match LRU cache of inspection results. Overlapping timeframes
+        # re-surface the same papers for the same prompt; a hit skips the
+        # whole API round-trip.
+        self._exact_cache: "OrderedDict[str, Any]" = OrderedDict()
+        # Raw LLM responses are also persisted on disk, so a restart or
+        # redeploy does not throw away (and re-bill) prior inspection work.
+        cache_dir = os.getenv(
+            "PAPERBIRD_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".cache", "paperbird", "llm"),
+        )
+        self._disk = diskcache.Cache(cache_dir, size_limit=2**30)
+        # Analyses currently being computed, keyed like the exact cache, so
+        # concurrent requests for the same (paper, prompt) share one call.
+        self._inflight: Dict[str, "asyncio.Future"] = {}
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, refreshing its LRU position."""
+        if key not in self._exact_cache:
+            return None
+        self._exact_cache.move_to_end(key)
+        return self._exact_cache[key]
+
+    def _cache_put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._exact_cache[key] = value
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > _CACHE_MAX_ENTRIES:
+            self._exact_cache.popitem(last=False)
+
+    async def aclose(self):
+        """Close the underlying HTTP client and the on-disk cache."""
+        await self._client.aclose()
+        self._disk.close()
+
+    async def _call_llama_api(
+        self,
+        prompt: str,
+        max_tokens: int = 512,
+        temperature: float = 0.0,
+        model: Optional[str] = None,
+    ) -> str:
+        """
+        Send a single-message chat completion request to the Llama API.
+
+        Args:
+            prompt: The user prompt to send
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
+            model: Model to query; defaults to the summary model
+
+        Returns:
+            The model's response text
+        """
+        model = model or self.summary_model
+
+        # Deterministic calls are content-addressed on disk; sampled ones
+        # (temperature > 0) are never cached.
+        cacheable = temperature == 0
+        if cacheable:
+            disk_key = hashlib.blake2b(
+                f"{model}|{prompt}|{temperature}|{max_tokens}".encode()
+            ).hexdigest()
+            hit = self._disk.get(disk_key)
+            if hit is not None:
+                return hit
+
+        payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+        response = await self._client.post(
+            self.API_URL, content=orjson.dumps(payload), headers=self.headers
+        )
+        response.raise_for_status()
+        try:
+            data = orjson.loads(response.content)
+            content = data["choices"][0]["message"]["content"]
+        except (orjson.JSONDecodeError, KeyError, IndexError, TypeError) as e:
+            # Providers can ship an error payload under a 200 (quota, model
+            # routing); surface it as an HTTP failure so callers' existing
+            # degradation paths apply instead of a raw KeyError
+            raise httpx.HTTPError(f"Malformed Llama API response: {e}") from e
+
+        if cacheable:
+            self._disk.set(disk_key, content, expire=_LLM_CACHE_TTL)
+
+        return content
+
+    async def analyze_paper(
+        self, paper: Dict[str, Any], user_prompt: str
+    ) -> Dict[str, Any]:
+        """
+        Analyze one paper with a single combined relevance-plus-summary call.
+
+        Merging the two stages into one prompt halves the API round-trips and
+        tokenizes the paper context once instead of twice.
+
+        Args:
+            paper: Dictionary containing paper information
+            user_prompt: The user's saved relevance prompt
+
+        Returns:
+            Dictionary with 'is_relevant', 'reason', and 'summary'
+            (None when the paper is not relevant)
+        """
+        key = _cache_key("analysis", paper.get("arxiv_id", ""), user_prompt)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return dict(cached)
+
+        # Requests over overlapping timeframes can ask about the same paper
+        # before the first answer lands; later callers await the first
+        # call's future instead of issuing a duplicate API call.
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return dict(await pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            analysis = await self._analyze_uncached(paper, user_prompt, key)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved; awaiters still see it raised
+            raise
+        else:
+            future.set_result(analysis)
+            return dict(analysis)
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _analyze_uncached(
+        self, paper: Dict[str, Any], user_prompt: str, key: str
+    ) -> Dict[str, Any]:
+        """Run the combined analysis call for a cache miss."""
+        prompt = _ANALYZE_PROMPT.format(
+            user_prompt=user_prompt,
+            title=paper.get("title", ""),
+            authors=paper.get("authors_str")
+            or ", ".join(paper.get("authors", [])),
+            categories=paper.get("categories_str")
+            or ", ".join(paper.get("categories", [])),
+            abstract=paper.get("abstract", "")[:_MAX_PROMPT_ABSTRACT_CHARS],
+        )
+
+        response_text = await self._call_llama_api(prompt, max_tokens=640)
+
+        try:
+            result = _extract_json(response_text)
+            is_relevant = bool(result.get("is_relevant", False))
+            analysis = {
+                "is_relevant": is_relevant,
+                "reason": result.get("reason", ""),
+                "summary": (result.get("summary") or None) if is_relevant else None,
+            }
+        except (ValueError, KeyError) as e:
+            logger.warning("Could not parse analysis response: %s", e)
+            return {
+                "is_relevant": False,
+                "reason": "Unparseable model response",
+                "summary": None,
+            }
+
+        self._cache_put(key, analysis)
+        return analysis
+
+    async def prompt_to_arxiv_query(self, user_prompt: str) -> str:
+        """
+        Translate a user's interest prompt into an arXiv boolean query.
+
+        Folding the result into the arXiv search shrinks the candidate set
+        server-side, so papers that never come back never cost an
+        inspection call. The translation is cached per prompt.
+
+        Args:
+            user_prompt: The user's saved relevance prompt
+
+        Returns:
+            An arXiv query expression, or '' when translation fails
+        """
+        key = _cache_key("arxiv_query", "", user_prompt)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            response_text = await self._call_llama_api(
+                _QUERY_PROMPT.format(user_prompt=user_prompt),
+                max_tokens=64,
+                model=self.relevance_model,
+            )
+        except httpx.HTTPError as e:
+            # The translation is a pure pre-filter; a Llama outage should
+            # degrade to an unfiltered search, not fail it. The failure is
+            # not cached so the next search retries the translation.
+            logger.warning("arXiv query translation failed: %s", e)
+            return ""
+
+        try:
+            query = str(_extract_json(response_text).get("query", "")).strip()
+        except (ValueError, AttributeError) as e:
+            logger.warning("Could not parse arXiv query response: %s", e)
+            query = ""
+
+        self._cache_put(key, query)
+        return query
+
+    def _build_batch_prompt(
+        self, papers: List[Dict[str, Any]], user_prompt: str
+    ) -> str:
+        """Build one prompt covering several papers, each tagged with [i]."""
+        sections = [
+            _BATCH_SECTION.format(
+                i=i,
+                title=paper.get("title", ""),
+                authors=paper.get("authors_str")
+                or ", ".join(paper.get("authors", [])),
+                categories=paper.get("categories_str")
+                or ", ".join(paper.get("categories", [])),
+                abstract=paper.get("abstract", "")[:_MAX_PROMPT_ABSTRACT_CHARS],
+            )
+            for i, paper in enumerate(papers)
+        ]
+        return _BATCH_PROMPT.format(
+            user_prompt=user_prompt, papers_block="\n\n".join(sections)
+        )
+
+    async def _analyze_chunk(
+        self, papers: List[Dict[str, Any]], user_prompt: str
+    ) -> List[Dict[str, Any]]:
+        """Analyze one chunk of papers with a single batched API call."""
+        prompt = self._build_batch_prompt(papers, user_prompt)
+        response_text = await self._call_llama_api(
+            prompt, max_tokens=512 * len(papers)
+        )
+
+        try:
+            verdicts = _BATCH_ADAPTER.validate_python(
+                _extract_json(response_text, opening="[")
+            )
+            by_index = {v.i: v for v in verdicts}
+            if set(by_index) != set(range(len(papers))):
+                raise ValueError(f"Indices {sorted(by_index)} do not cover chunk")
+        except ValueError as e:
+            # Fall back to one call per paper when the batched JSON is broken.
+            logger.warning("Batch analysis unparseable, retrying singly: %s", e)
+            return list(
+                await asyncio.gather(
+                    *(self.analyze_paper(p, user_prompt) for p in papers)
+                )
+            )
+
+        return [
+            {
+                "is_relevant": by_index[i].is_relevant,
+                "reason": by_index[i].reason,
+                "summary": by_index[i].summary if by_index[i].is_relevant else None,
+            }
+            for i in range(len(papers))
+        ]
+
+    async def analyze_papers_batch(
+        self, papers: List[Dict[str, Any]], user_prompt: str, k: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many papers, packing k of them into each Llama request.
+
+        Batching amortizes the HTTP round-trip and the instruction prefix
+        across k papers instead of paying them per paper.
+
+        Args:
+            papers: List of paper dictionaries
+            user_prompt: The user's saved relevance prompt
+            k: Number of papers per API request
+
+        Returns:
+            One analysis dictionary per paper, in input order, each with
+            'is_relevant', 'reason', and 'summary'
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(papers)
+
+        # Serve exact-cache hits first so only misses are sent to the API.
+        misses = []
+        for idx, paper in enumerate(papers):
+            key = _cache_key("analysis", paper.get("arxiv_id", ""), user_prompt)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[idx] = dict(cached)
+            else:
+                misses.append(idx)
+
+        chunks = [misses[pos : pos + k] for pos in range(0, len(misses), k)]
+
+        async def _run_chunk(chunk: List[int]) -> None:
+            chunk_papers = [papers[idx] for idx in chunk]
+            try:
+                analyses = await self._analyze_chunk(chunk_papers, user_prompt)
+            except httpx.HTTPError as e:
+                logger.warning("Batch analysis failed for chunk: %s", e)
+                # Transient failure: report the placeholder but never cache
+                # it, so these papers are re-inspected once the API recovers
+                for idx in chunk:
+                    results[idx] = {
+                        "is_relevant": False,
+                        "reason": "Inspection failed",
+                        "summary": None,
+                    }
+                return
+            for idx, analysis in zip(chunk, analyses):
+                key = _cache_key(
+                    "analysis", papers[idx].get("arxiv_id", ""), user_prompt
+                )
+                self._cache_put(key, analysis)
+                results[idx] = dict(analysis)
+
+        await asyncio.gather(*(_run_chunk(chunk) for chunk in chunks))
+        return results
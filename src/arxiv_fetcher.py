@@ -5,12 +5,204 @@ This module fetches the latest papers from arXiv and extracts relevant informati
 such as title, abstract, and authors.
 """
 
+import asyncio
 import datetime
+import functools
+import hashlib
+import heapq
+import io
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
-import feedparser
+import diskcache
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# lxml is the fast path; the stdlib expat-backed iterparse handles the same
+# eight Atom fields when lxml is not installed, just without the
+# preceding-sibling cleanup its tree API allows.
+try:
+    from lxml import etree
+
+    _HAVE_LXML = True
+except ImportError:
+    from xml.etree import ElementTree as etree
+
+    _HAVE_LXML = False
+
+logger = logging.getLogger(__name__)
+
+# Namespaces used by the arXiv Atom feed
+_ATOM_NS = {
+    "a": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+_ATOM_ENTRY = "{http://www.w3.org/2005/Atom}entry"
+
+# How long persisted feed parses stay fresh on disk before revalidation
+_FEED_CACHE_TTL = 3600
+
+# Splits a search term around its 'all:' field in one precompiled match
+_ALL_RE = re.compile(r"^(.*?)all:(.+)$", re.DOTALL)
+
+
+def _release_entry(entry) -> None:
+    """Free a consumed entry (and, under lxml, its preceding siblings)."""
+    entry.clear()
+    if _HAVE_LXML:
+        while entry.getprevious() is not None:
+            del entry.getparent()[0]
+
+
+def _is_older_than(updated: Optional[str], since: datetime.datetime) -> bool:
+    """Check whether an entry's updated timestamp predates a cutoff."""
+    if not updated:
+        return False
+    try:
+        updated_dt = datetime.datetime.fromisoformat(updated.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=datetime.timezone.utc)
+    return updated_dt < since
+
+
+@dataclass(slots=True)
+class Paper:
+    """A single paper row, viewed out of a Papers container."""
+
+    title: str
+    abstract: str
+    authors: List[str]
+    authors_str: str
+    published: str
+    updated: Optional[str]
+    link: str
+    pdf_link: Optional[str]
+    arxiv_id: str
+    categories: List[str]
+    categories_str: str
+
+
+class Papers:
+    """
+    Columnar (structure-of-arrays) container for parsed papers.
+
+    One list per field means one append per column per entry instead of a
+    fresh ~10-slot dict per paper, and consumers that want a whole column
+    (all titles, all abstracts) get it without walking rows. `to_dicts()`
+    recovers the historical row-dict shape for callers that expect it.
+    """
+
+    __slots__ = (
+        "titles",
+        "abstracts",
+        "authors",
+        "authors_strs",
+        "published",
+        "updated",
+        "links",
+        "pdf_links",
+        "arxiv_ids",
+        "categories",
+        "categories_strs",
+    )
+
+    def __init__(self):
+        for slot in self.__slots__:
+            setattr(self, slot, [])
+
+    def __len__(self) -> int:
+        return len(self.arxiv_ids)
+
+    def __getitem__(self, i: int) -> Paper:
+        """Return row i as a slotted Paper with fixed-offset field access."""
+        return Paper(
+            title=self.titles[i],
+            abstract=self.abstracts[i],
+            authors=self.authors[i],
+            authors_str=self.authors_strs[i],
+            published=self.published[i],
+            updated=self.updated[i],
+            link=self.links[i],
+            pdf_link=self.pdf_links[i],
+            arxiv_id=self.arxiv_ids[i],
+            categories=self.categories[i],
+            categories_str=self.categories_strs[i],
+        )
+
+    def append(
+        self,
+        *,
+        title: str,
+        abstract: str,
+        authors: List[str],
+        published: str,
+        updated: Optional[str],
+        link: str,
+        pdf_link: Optional[str],
+        arxiv_id: str,
+        categories: List[str],
+    ) -> None:
+        """Append one paper's fields across the columns."""
+        self.titles.append(title)
+        self.abstracts.append(abstract)
+        self.authors.append(authors)
+        # Joined once here so prompt builders and formatters downstream do
+        # not redo the join per LLM call
+        self.authors_strs.append(", ".join(authors))
+        self.published.append(published)
+        self.updated.append(updated)
+        self.links.append(link)
+        self.pdf_links.append(pdf_link)
+        self.arxiv_ids.append(arxiv_id)
+        self.categories.append(categories)
+        self.categories_strs.append(", ".join(categories))
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Materialize row i in the historical dict shape."""
+        return {
+            "title": self.titles[i],
+            "abstract": self.abstracts[i],
+            "authors": self.authors[i],
+            "authors_str": self.authors_strs[i],
+            "published": self.published[i],
+            "updated": self.updated[i],
+            "link": self.links[i],
+            "pdf_link": self.pdf_links[i],
+            "arxiv_id": self.arxiv_ids[i],
+            "categories": self.categories[i],
+            "categories_str": self.categories_strs[i],
+        }
+
+    def copy(self) -> "Papers":
+        """Return a shallow copy with fresh column lists.
+
+        Cached fetch results are handed out as copies so a caller
+        appending to (or clearing) its result cannot corrupt the shared
+        cached instance; the per-row values themselves are shared.
+        """
+        dup = Papers()
+        for slot in self.__slots__:
+            getattr(dup, slot).extend(getattr(self, slot))
+        return dup
+
+    def iter_rows(self):
+        """Yield all rows lazily as dictionaries."""
+        return (self.row(i) for i in range(len(self)))
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize all rows as dictionaries."""
+        return [self.row(i) for i in range(len(self))]
 
 
 class ArxivFetcher:
@@ -27,6 +219,7 @@ class ArxivFetcher:
         default_max_results: int = 50,
         default_sort_by: str = "submittedDate",
         default_sort_order: str = "descending",
+        disk_cache_ttl: int = _FEED_CACHE_TTL,
     ):
         """
         Initialize the ArxivFetcher with default values.
@@ -37,6 +230,8 @@ class ArxivFetcher:
             default_max_results: Default maximum number of results to return
             default_sort_by: Default field to sort by ('submittedDate', 'relevance', etc.)
             default_sort_order: Default order of sorting ('ascending' or 'descending')
+            disk_cache_ttl: Seconds a persisted feed parse is served without
+                revalidating against arXiv
         """
         self.default_search_term = default_search_term
         self.default_categories = default_categories or ["cs.AI", "cs.LG"]
@@ -44,16 +239,62 @@ class ArxivFetcher:
         self.default_sort_by = default_sort_by
         self.default_sort_order = default_sort_order
 
-    def fetch_papers(
+        # Reuse one session so repeated fetches keep the connection to
+        # export.arxiv.org alive instead of paying a TCP+TLS handshake per
+        # call; transient API errors are retried with backoff.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Async path: one shared client, with a semaphore keeping concurrent
+        # queries within what the arXiv API tolerates per host
+        self._async_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+        )
+        self._async_semaphore = asyncio.Semaphore(8)
+
+        # Conditional-request cache: query_url -> (etag, last_modified,
+        # parsed Papers). When arXiv answers 304 Not Modified we skip both
+        # the body transfer and the re-parse.
+        self._conditional_cache: Dict[str, tuple] = {}
+
+        # Parsed feeds are also persisted on disk so repeated runs of the
+        # same script (the common development loop) skip both the network
+        # and the parse while the entry is fresh, and revalidate with a
+        # conditional GET once it goes stale.
+        cache_dir = os.getenv(
+            "PAPERBIRD_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".cache", "paperbird", "feeds"),
+        )
+        self._disk = diskcache.Cache(cache_dir, size_limit=2**28)
+        self._disk_ttl = disk_cache_ttl
+
+        # In-process memoization of whole fetch+parse results, keyed by the
+        # exact query URL; repeated identical queries in one run skip even
+        # the conditional 304 probe. Per-instance so the cache dies with
+        # the fetcher.
+        self._fetch_cached = functools.lru_cache(maxsize=128)(self._fetch_url)
+
+    def _build_query_url(
         self,
-        search_query: str = "",
-        categories: List[str] = None,
-        max_results: int = None,
-        sort_by: str = None,
-        sort_order: str = None,
-    ) -> List[Dict[str, Any]]:
+        search_query: str,
+        categories: List[str],
+        max_results: int,
+        sort_by: str,
+        sort_order: str,
+    ) -> str:
         """
-        Fetch papers from arXiv based on the provided parameters.
+        Build the full arXiv API query URL from resolved parameters.
 
         Args:
             search_query: Search terms to filter papers
@@ -63,32 +304,24 @@ class ArxivFetcher:
             sort_order: Order of sorting ('ascending' or 'descending')
 
         Returns:
-            List of dictionaries containing paper information
+            The query URL
         """
-        # Use default values if parameters are not provided
-        categories = categories if categories is not None else self.default_categories
-        max_results = (
-            max_results if max_results is not None else self.default_max_results
-        )
-        sort_by = sort_by if sort_by is not None else self.default_sort_by
-        sort_order = sort_order if sort_order is not None else self.default_sort_order
-
         # Construct the search query
-        search_term = self.default_search_term
-
-        # Use provided search query if available
-        if search_query:
-            search_term = search_query
+        search_term = search_query or self.default_search_term
 
-        # Add quotes around search terms if they don't already have quotes
+        # Quote the free-text part of the query unless the caller already
+        # did; the single precompiled match replaces the per-call in/split
+        # scans of the old branchy version
         if search_term and not (
             search_term.startswith('"') and search_term.endswith('"')
         ):
-            # Extract the part after "all:" if it exists
-            if "all:" in search_term:
-                prefix, term = search_term.split("all:", 1)
+            match = _ALL_RE.match(search_term)
+            if match is not None:
+                prefix, term = match.groups()
                 search_term = f'{prefix}all:"{term.strip()}"'
-            else:
+            elif ":" not in search_term:
+                # Leave other fielded queries (cat:, submittedDate:, ...)
+                # untouched; quoting them would turn them into phrase searches
                 search_term = f'"{search_term}"'
 
         # Add categories if provided and search_query doesn't already specify a category
@@ -98,70 +331,553 @@ class ArxivFetcher:
                 category_query = " OR ".join([f"cat:{cat}" for cat in categories])
                 search_term = f"{search_term} AND {category_query}"
 
-        params = {
-            "search_query": search_term,
-            "start": 0,
-            "max_results": max_results,
-            "sortBy": sort_by,
-            "sortOrder": sort_order,
-        }
+        # Only the search term needs escaping; the remaining fields are
+        # known-safe values, so one f-string replaces the urlencode dict
+        return (
+            f"{self.BASE_URL}search_query={quote_plus(search_term)}"
+            f"&start=0&max_results={max_results}"
+            f"&sortBy={sort_by}&sortOrder={sort_order}"
+        )
 
-        # Construct the full URL
-        query_url = self.BASE_URL + urlencode(params)
-        print(f"Query URL: {query_url}")
+    def _iter_entries(self, source, since: datetime.datetime = None):
+        """
+        Lazily yield one field-dict per feed entry.
 
-        try:
-            # Fetch the feed using requests
-            response = requests.get(query_url)
-            print(f"Response status code: {response.status_code}")
-
-            if response.status_code == 200:
-                # Parse the response content using feedparser
-                feed = feedparser.parse(response.content)
-                print(f"Feed entries: {len(feed.entries)}")
-            else:
-                print(f"Error fetching arXiv API: {response.status_code}")
-                return []
-        except Exception as e:
-            print(f"Exception when fetching arXiv API: {e}")
-            return []
+        Entries are pulled one at a time with lxml's iterparse and cleared
+        as soon as their fields are extracted, so peak memory is one entry
+        rather than the whole document tree, and consumers can start work
+        before the feed is fully parsed.
+
+        Args:
+            source: Binary file-like object with the Atom response body
+            since: Skip entries whose updated timestamp predates this
 
-        # Process the results
-        papers = []
-        for entry in feed.entries:
+        Yields:
+            Dictionaries of paper fields, one per entry
+        """
+        if _HAVE_LXML:
+            events = etree.iterparse(source, events=("end",), tag=_ATOM_ENTRY)
+        else:
+            # Stdlib iterparse has no tag filter; skip non-entry elements
+            events = (
+                item
+                for item in etree.iterparse(source, events=("end",))
+                if item[1].tag == _ATOM_ENTRY
+            )
+        for _, entry in events:
+            updated = entry.findtext("a:updated", namespaces=_ATOM_NS)
+            if since is not None and _is_older_than(updated, since):
+                _release_entry(entry)
+                continue
             # Extract authors
-            authors = [author.name for author in entry.authors]
+            authors = [
+                name.text.strip()
+                for name in entry.findall("a:author/a:name", _ATOM_NS)
+                if name.text
+            ]
 
             # Extract categories
-            categories = [tag["term"] for tag in entry.tags] if "tags" in entry else []
-
-            # Create a paper dictionary
-            paper = {
-                "title": entry.title,
-                "abstract": entry.summary,
-                "authors": authors,
-                "published": entry.published,
-                "updated": entry.updated if "updated" in entry else None,
-                "link": entry.link,
-                "pdf_link": next(
-                    (
-                        link.href
-                        for link in entry.links
-                        if link.rel == "alternate" and link.type == "application/pdf"
-                    ),
-                    None,
+            entry_categories = [
+                tag.get("term") for tag in entry.findall("a:category", _ATOM_NS)
+            ]
+
+            entry_id = entry.findtext("a:id", default="", namespaces=_ATOM_NS)
+
+            # Resolve the abstract and PDF links in one explicit pass instead
+            # of two generator scans per entry
+            alt_link = None
+            pdf_link = None
+            for link in entry.findall("a:link", _ATOM_NS):
+                if link.get("rel") != "alternate":
+                    continue
+                if alt_link is None:
+                    alt_link = link.get("href")
+                if pdf_link is None and link.get("type") == "application/pdf":
+                    pdf_link = link.get("href")
+                if alt_link is not None and pdf_link is not None:
+                    break
+
+            fields = dict(
+                title=" ".join(
+                    entry.findtext(
+                        "a:title", default="", namespaces=_ATOM_NS
+                    ).split()
                 ),
-                "arxiv_id": entry.id.split("/abs/")[-1],
-                "categories": categories,
-            }
+                abstract=entry.findtext(
+                    "a:summary", default="", namespaces=_ATOM_NS
+                ).strip(),
+                authors=authors,
+                published=entry.findtext(
+                    "a:published", default="", namespaces=_ATOM_NS
+                ),
+                updated=updated,
+                link=alt_link if alt_link is not None else entry_id,
+                pdf_link=pdf_link,
+                arxiv_id=entry_id.rpartition("/abs/")[2],
+                categories=entry_categories,
+            )
+
+            # Release the entry (and any already-consumed siblings) so the
+            # parsed tree never holds more than the entry in flight
+            _release_entry(entry)
+
+            yield fields
+
+    def _parse_feed(
+        self,
+        source,
+        max_results: int = None,
+        since: datetime.datetime = None,
+    ) -> Papers:
+        """
+        Parse an arXiv Atom response stream into a Papers container.
+
+        Thin materializing wrapper over `_iter_entries`; islice cuts the
+        generator off at max_results, so trailing entries the caller will
+        not see are never parsed.
+
+        Args:
+            source: Binary file-like object with the Atom response body
+            max_results: Stop parsing once this many entries were kept
+            since: Skip entries whose updated timestamp predates this
+
+        Returns:
+            Papers container with the parsed paper information
+        """
+        papers = Papers()
+        for fields in islice(self._iter_entries(source, since=since), max_results):
+            papers.append(**fields)
+        logger.debug("Feed entries: %d", len(papers))
+        return papers
+
+    def _conditional_headers(self, query_url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached URL."""
+        headers = {}
+        cached = self._conditional_cache.get(query_url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _store_conditional(self, query_url: str, headers, papers: Papers) -> None:
+        """Remember a response's validators alongside its parsed papers."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            self._conditional_cache[query_url] = (etag, last_modified, papers)
+
+    def _resolve_params(
+        self,
+        categories: List[str] = None,
+        max_results: int = None,
+        sort_by: str = None,
+        sort_order: str = None,
+    ):
+        """Fill unset parameters from the instance defaults."""
+        return (
+            categories if categories is not None else self.default_categories,
+            max_results if max_results is not None else self.default_max_results,
+            sort_by if sort_by is not None else self.default_sort_by,
+            sort_order if sort_order is not None else self.default_sort_order,
+        )
+
+    def fetch_papers(
+        self,
+        search_query: str = "",
+        categories: List[str] = None,
+        max_results: int = None,
+        sort_by: str = None,
+        sort_order: str = None,
+        since: datetime.datetime = None,
+    ) -> Papers:
+        """
+        Fetch papers from arXiv based on the provided parameters.
+
+        Args:
+            search_query: Search terms to filter papers
+            categories: List of arXiv categories (e.g., ['cs.AI', 'cs.LG'])
+            max_results: Maximum number of results to return
+            sort_by: Field to sort by ('submittedDate', 'relevance', etc.)
+            sort_order: Order of sorting ('ascending' or 'descending')
+            since: Skip entries last updated before this time (for
+                incremental polling)
+
+        Returns:
+            Papers container with the parsed paper information
+        """
+        categories, max_results, sort_by, sort_order = self._resolve_params(
+            categories, max_results, sort_by, sort_order
+        )
+        query_url = self._build_query_url(
+            search_query, categories, max_results, sort_by, sort_order
+        )
+        logger.debug("Query URL: %s", query_url)
+
+        try:
+            if since is not None:
+                # Time-filtered results depend on more than the URL; skip the
+                # memo and go straight to the network
+                papers = self._fetch_url(query_url, max_results, since)
+            else:
+                papers = self._fetch_cached(query_url, max_results)
+        except Exception as e:
+            # _fetch_url raises on failure, so neither the memo nor the
+            # disk cache ever stores an empty error result; the next call
+            # retries the network
+            logger.warning("Exception when fetching arXiv API: %s", e)
+            return Papers()
+        # The memo and the conditional-GET cache hand back shared instances;
+        # each caller gets its own copy so mutating a result cannot corrupt
+        # future cached responses
+        return papers.copy()
+
+    def iter_papers(
+        self,
+        search_query: str = "",
+        categories: List[str] = None,
+        max_results: int = None,
+        sort_by: str = None,
+        sort_order: str = None,
+        since: datetime.datetime = None,
+    ):
+        """
+        Stream paper field-dicts lazily as the feed is parsed.
+
+        Unlike `fetch_papers` nothing is materialized up front: each row is
+        yielded while the response body is still being read, so a consumer
+        that stops early (or processes rows one at a time) never pays for
+        the rest of the feed. Results are not memoized on this path.
+
+        Args:
+            search_query: Search terms to filter papers
+            categories: List of arXiv categories (e.g., ['cs.AI', 'cs.LG'])
+            max_results: Maximum number of results to yield
+            sort_by: Field to sort by ('submittedDate', 'relevance', etc.)
+            sort_order: Order of sorting ('ascending' or 'descending')
+            since: Skip entries last updated before this time
 
-            papers.append(paper)
+        Yields:
+            Dictionaries of paper fields, one per entry
+        """
+        categories, max_results, sort_by, sort_order = self._resolve_params(
+            categories, max_results, sort_by, sort_order
+        )
+        query_url = self._build_query_url(
+            search_query, categories, max_results, sort_by, sort_order
+        )
+        logger.debug("Query URL: %s", query_url)
+
+        try:
+            response = self._session.get(
+                query_url,
+                timeout=(5, 30),
+                stream=True,
+                headers=self._conditional_headers(query_url),
+            )
+        except requests.RequestException as e:
+            logger.warning("Exception when fetching arXiv API: %s", e)
+            return
+        with response:
+            logger.debug("Response status code: %s", response.status_code)
+            if response.status_code == 304:
+                logger.debug("arXiv feed unchanged, serving cached parse")
+                cached = self._conditional_cache[query_url][2]
+                yield from islice(
+                    (cached.row(i) for i in range(len(cached))), max_results
+                )
+                return
+            if response.status_code != 200:
+                logger.warning(
+                    "Error fetching arXiv API: %s", response.status_code
+                )
+                return
+            response.raw.decode_content = True
+            yield from islice(
+                self._iter_entries(response.raw, since=since), max_results
+            )
+
+    def clear_cache(self) -> None:
+        """Drop memoized and persisted fetch results (e.g. to force a refresh)."""
+        self._fetch_cached.cache_clear()
+        self._disk.clear()
+
+    def _fetch_url(
+        self,
+        query_url: str,
+        max_results: int = None,
+        since: datetime.datetime = None,
+    ) -> Papers:
+        """
+        Perform one HTTP fetch and parse of a fully-built query URL.
 
+        Raises on network errors and non-200 responses instead of returning
+        an empty container, so the lru_cache memo wrapped around this method
+        never stores a failure; fetch_papers turns the exception into the
+        empty-result fallback.
+        """
+        # Time-filtered results depend on more than the URL; they bypass the
+        # persistent cache the same way fetch_papers bypasses the memo
+        disk_key = None
+        if since is None:
+            disk_key = hashlib.blake2b(query_url.encode()).hexdigest()
+            entry = self._disk.get(disk_key)
+            if entry is not None:
+                fresh_until, etag, last_modified, papers = entry
+                if time.time() < fresh_until:
+                    logger.debug("Serving arXiv feed from disk cache")
+                    return papers
+                # Stale: fall through to the network, but seed the
+                # validators so the request below revalidates with a
+                # conditional GET instead of refetching unconditionally
+                if etag or last_modified:
+                    self._conditional_cache.setdefault(
+                        query_url, (etag, last_modified, papers)
+                    )
+        # Fetch the feed over the pooled session; (connect, read) timeout
+        # keeps a wedged arXiv endpoint from hanging the caller
+        response = self._session.get(
+            query_url,
+            timeout=(5, 30),
+            stream=True,
+            headers=self._conditional_headers(query_url),
+        )
+        with response:
+            logger.debug("Response status code: %s", response.status_code)
+
+            if response.status_code == 304:
+                logger.debug("arXiv feed unchanged, serving cached parse")
+                etag, last_modified, papers = self._conditional_cache[
+                    query_url
+                ]
+                if disk_key is not None:
+                    # Revalidated: restart the freshness window without
+                    # re-storing a new parse
+                    self._disk.set(
+                        disk_key,
+                        (
+                            time.time() + self._disk_ttl,
+                            etag,
+                            last_modified,
+                            papers,
+                        ),
+                    )
+                return papers
+            if response.status_code != 200:
+                raise requests.HTTPError(
+                    f"arXiv API returned {response.status_code}",
+                    response=response,
+                )
+            # Feed the undecoded socket stream straight into iterparse
+            # instead of buffering the whole body in response.content
+            response.raw.decode_content = True
+            papers = self._parse_feed(
+                response.raw, max_results=max_results, since=since
+            )
+        self._store_conditional(query_url, response.headers, papers)
+        if disk_key is not None:
+            self._disk.set(
+                disk_key,
+                (
+                    time.time() + self._disk_ttl,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    papers,
+                ),
+            )
         return papers
 
+    def fetch_papers_per_category(
+        self,
+        categories: List[str] = None,
+        max_results: int = None,
+    ) -> Papers:
+        """
+        Fetch each category with its own request and merge client-side.
+
+        A combined 'cat:cs.AI OR cat:cs.LG' query serializes everything into
+        one response; one request per category overlaps the HTTP waits in a
+        thread pool and parses the smaller responses independently. The
+        per-category results are heap-merged by published date, newest
+        first, deduplicating papers that are cross-listed in several
+        categories. The merge requires each input to be published-descending
+        already, so the per-category fetches pin sort_by/sort_order rather
+        than inherit the instance defaults.
+
+        Args:
+            categories: List of arXiv categories (e.g., ['cs.AI', 'cs.LG'])
+            max_results: Maximum number of merged results to return
+
+        Returns:
+            Papers container with the merged paper information
+        """
+        categories, max_results, _, _ = self._resolve_params(
+            categories, max_results
+        )
+        if len(categories) <= 1:
+            return self.fetch_papers(
+                categories=categories, max_results=max_results
+            )
+
+        # Workers share the pooled session (thread-safe, and its pool is
+        # sized for this fan-out) and the per-URL caches
+        with ThreadPoolExecutor(
+            max_workers=min(8, len(categories))
+        ) as executor:
+            per_category = list(
+                executor.map(
+                    lambda cat: self.fetch_papers(
+                        categories=[cat],
+                        max_results=max_results,
+                        sort_by="submittedDate",
+                        sort_order="descending",
+                    ),
+                    categories,
+                )
+            )
+
+        merged = Papers()
+        seen = set()
+        # One row iterator per container, bound through the method call —
+        # inner generator expressions here would all close over the same
+        # loop variable and end up reading only the last category
+        rows = heapq.merge(
+            *(papers.iter_rows() for papers in per_category),
+            key=lambda row: row["published"],
+            reverse=True,
+        )
+        for row in rows:
+            if row["arxiv_id"] in seen:
+                continue
+            seen.add(row["arxiv_id"])
+            merged.append(
+                title=row["title"],
+                abstract=row["abstract"],
+                authors=row["authors"],
+                published=row["published"],
+                updated=row["updated"],
+                link=row["link"],
+                pdf_link=row["pdf_link"],
+                arxiv_id=row["arxiv_id"],
+                categories=row["categories"],
+            )
+            if len(merged) >= max_results:
+                break
+        return merged
+
+    async def fetch_papers_async(
+        self,
+        search_query: str = "",
+        categories: List[str] = None,
+        max_results: int = None,
+        sort_by: str = None,
+        sort_order: str = None,
+        since: datetime.datetime = None,
+    ) -> Papers:
+        """
+        Fetch papers from arXiv without blocking the event loop.
+
+        Multiple queries issued concurrently overlap their HTTP waits; a
+        semaphore keeps the fan-out within the per-host limit and transient
+        API errors are retried with exponential backoff.
+
+        Args:
+            search_query: Search terms to filter papers
+            categories: List of arXiv categories (e.g., ['cs.AI', 'cs.LG'])
+            max_results: Maximum number of results to return
+            sort_by: Field to sort by ('submittedDate', 'relevance', etc.)
+            sort_order: Order of sorting ('ascending' or 'descending')
+            since: Skip entries last updated before this time (for
+                incremental polling)
+
+        Returns:
+            Papers container with the parsed paper information
+        """
+        categories, max_results, sort_by, sort_order = self._resolve_params(
+            categories, max_results, sort_by, sort_order
+        )
+        query_url = self._build_query_url(
+            search_query, categories, max_results, sort_by, sort_order
+        )
+        logger.debug("Query URL: %s", query_url)
+
+        async with self._async_semaphore:
+            for attempt in range(3):
+                try:
+                    response = await self._async_client.get(
+                        query_url, headers=self._conditional_headers(query_url)
+                    )
+                except httpx.TransportError as e:
+                    logger.warning("Exception when fetching arXiv API: %s", e)
+                else:
+                    logger.debug("Response status code: %s", response.status_code)
+                    if response.status_code == 304:
+                        logger.debug("arXiv feed unchanged, serving cached parse")
+                        # Copied so callers cannot mutate the cached parse
+                        return self._conditional_cache[query_url][2].copy()
+                    if response.status_code == 200:
+                        papers = self._parse_feed(
+                            io.BytesIO(response.content),
+                            max_results=max_results,
+                            since=since,
+                        )
+                        self._store_conditional(
+                            query_url, response.headers, papers
+                        )
+                        return papers.copy()
+                    if response.status_code not in (429, 500, 502, 503, 504):
+                        logger.warning(
+                            "Error fetching arXiv API: %s", response.status_code
+                        )
+                        return Papers()
+                await asyncio.sleep(0.5 * 2**attempt)
+
+        logger.warning("Giving up on arXiv query after retries")
+        return Papers()
+
+    async def search_papers_async(
+        self,
+        query: str,
+        categories: List[str] = None,
+        max_results: int = None,
+    ) -> Papers:
+        """
+        Search for papers on arXiv without blocking the event loop.
+
+        Args:
+            query: Search query
+            categories: List of arXiv categories (e.g., ['cs.AI', 'cs.LG'])
+            max_results: Maximum number of results to return
+
+        Returns:
+            Papers container with the parsed paper information
+        """
+        return await self.fetch_papers_async(
+            search_query=query,
+            categories=categories,
+            max_results=max_results,
+        )
+
+    async def aclose(self):
+        """Close the shared async HTTP client."""
+        await self._async_client.aclose()
+
+    def close(self):
+        """Close the pooled HTTP session and the on-disk cache."""
+        self._session.close()
+        self._disk.close()
+
+    def __enter__(self) -> "ArxivFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def fetch_latest_papers(
         self, categories: List[str] = None, max_results: int = None
-    ) -> List[Dict[str, Any]]:
+    ) -> Papers:
         """
         Fetch the latest papers from arXiv in specific categories.
 
@@ -170,14 +886,9 @@ class ArxivFetcher:
             max_results: Maximum number of results to return
 
         Returns:
-            List of dictionaries containing paper information
+            Papers container with the parsed paper information
         """
-        # Use default values if parameters are not provided
-        categories = categories if categories is not None else self.default_categories
-        max_results = (
-            max_results if max_results is not None else self.default_max_results
-        )
-
+        # fetch_papers resolves unset parameters through _resolve_params
         return self.fetch_papers(categories=categories, max_results=max_results)
 
     def search_papers(
@@ -185,7 +896,7 @@ class ArxivFetcher:
         query: str,
         categories: List[str] = None,
         max_results: int = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Papers:
         """
         Search for papers on arXiv based on a query.
 
@@ -195,14 +906,9 @@ class ArxivFetcher:
             max_results: Maximum number of results to return
 
         Returns:
-            List of dictionaries containing paper information
+            Papers container with the parsed paper information
         """
-        # Use default values if parameters are not provided
-        categories = categories if categories is not None else self.default_categories
-        max_results = (
-            max_results if max_results is not None else self.default_max_results
-        )
-
+        # fetch_papers resolves unset parameters through _resolve_params
         return self.fetch_papers(
             search_query=query,
             categories=categories,
@@ -220,17 +926,16 @@ def format_paper_info(paper: Dict[str, Any]) -> str:
     Returns:
         Formatted string with paper information
     """
-    title = paper["title"]
-    authors = ", ".join(paper["authors"])
-    abstract = paper["abstract"]
-    published = paper["published"]
+    authors = paper.get("authors_str") or ", ".join(paper["authors"])
     arxiv_id = paper["arxiv_id"]
 
-    formatted_info = f"Title: {title}\n"
-    formatted_info += f"Authors: {authors}\n"
-    formatted_info += f"Published: {published}\n"
-    formatted_info += f"arXiv ID: {arxiv_id}\n"
-    formatted_info += f"Abstract: {abstract}\n"
-    formatted_info += f"Link: https://arxiv.org/abs/{arxiv_id}\n"
-
-    return formatted_info
+    # One f-string, one allocation — repeated += rebuilt the growing string
+    # on every line
+    return (
+        f"Title: {paper['title']}\n"
+        f"Authors: {authors}\n"
+        f"Published: {paper['published']}\n"
+        f"arXiv ID: {arxiv_id}\n"
+        f"Abstract: {paper['abstract']}\n"
+        f"Link: https://arxiv.org/abs/{arxiv_id}\n"
+    )
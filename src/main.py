@@ -4,6 +4,8 @@ Main script to demonstrate the ArxivFetcher module.
 This script fetches the latest papers from arXiv and displays their information.
 """
 
+import asyncio
+import logging
 import os
 import sys
 
@@ -11,6 +13,7 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 # Import the ArxivFetcher class from the src package
+from src.ai_inspector import AIInspector
 from src.arxiv_fetcher import ArxivFetcher, format_paper_info
 
 
@@ -18,6 +21,10 @@ def main():
     """
     Main function to demonstrate the ArxivFetcher module.
     """
+    # Library diagnostics (query URLs, status codes) are debug-level; keep
+    # them off unless explicitly raised
+    logging.basicConfig(level=logging.WARNING)
+
     print("Fetching latest papers from arXiv...")
 
     # Create an instance of ArxivFetcher with custom default values
@@ -48,11 +55,32 @@ def main():
     print(f"Found {len(category_papers)} papers in AI and ML category.\n")
 
     # Display information for each paper in the category
-    for i, paper in enumerate(category_papers, 1):
+    for i, paper in enumerate(category_papers.to_dicts(), 1):
         print(f"Category Paper {i}:")
         print(format_paper_info(paper))
         print("-" * 80)  # Separator
 
+    # When a Llama API key is configured, run the papers through the
+    # inspector as well — batched, so the demo pays a handful of API calls
+    # instead of one per paper.
+    if os.getenv("LLAMA_API_KEY"):
+        user_prompt = (
+            "I am a product manager tracking research on recommender systems."
+        )
+        inspector = AIInspector()
+
+        async def _analyze():
+            try:
+                return await inspector.analyze_papers_batch(
+                    category_papers.to_dicts(), user_prompt
+                )
+            finally:
+                await inspector.aclose()
+
+        analyses = asyncio.run(_analyze())
+        relevant = sum(1 for analysis in analyses if analysis["is_relevant"])
+        print(f"\nInspector marked {relevant} of {len(analyses)} papers relevant.")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,154 @@
+"""Tests for the ArxivFetcher module."""
+
+import io
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from src.arxiv_fetcher import ArxivFetcher, Papers
+
+_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2601.00001v1</id>
+    <updated>2026-01-05T00:00:00Z</updated>
+    <published>2026-01-05T00:00:00Z</published>
+    <title>Paper 2601.00001</title>
+    <summary>Abstract 2601.00001</summary>
+    <author><name>A. Author</name></author>
+    <category term="cs.AI"/>
+    <link rel="alternate" href="http://arxiv.org/abs/2601.00001v1"/>
+  </entry>
+</feed>
+"""
+
+
+class _FakeRaw(io.BytesIO):
+    """BytesIO that tolerates the decode_content attribute set on it."""
+
+
+class _FakeResponse:
+    def __init__(self, body):
+        self.status_code = 200
+        self.raw = _FakeRaw(body)
+        self.headers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+
+def _make_papers(rows):
+    papers = Papers()
+    for row in rows:
+        papers.append(**row)
+    return papers
+
+
+def _row(arxiv_id, published, category):
+    return dict(
+        title=f"Paper {arxiv_id}",
+        abstract=f"Abstract {arxiv_id}",
+        authors=["A. Author"],
+        published=published,
+        updated=published,
+        link=f"https://arxiv.org/abs/{arxiv_id}",
+        pdf_link=None,
+        arxiv_id=arxiv_id,
+        categories=[category],
+    )
+
+
+def test_per_category_merge_interleaves_and_dedupes(monkeypatch, tmp_path):
+    """The merged result must contain every category's papers, newest first,
+    with cross-listed papers deduplicated — not just the last category's
+    rows (regression: the merge once late-bound its row generators)."""
+    monkeypatch.setenv("PAPERBIRD_CACHE_DIR", str(tmp_path))
+    # Instance defaults must not leak into the merge's ordering precondition
+    fetcher = ArxivFetcher(default_sort_order="ascending")
+    try:
+        by_category = {
+            "cs.AI": _make_papers(
+                [
+                    _row("2601.00001", "2026-01-05T00:00:00Z", "cs.AI"),
+                    # Cross-listed in both categories
+                    _row("2601.00002", "2026-01-03T00:00:00Z", "cs.AI"),
+                ]
+            ),
+            "cs.LG": _make_papers(
+                [
+                    _row("2601.00003", "2026-01-04T00:00:00Z", "cs.LG"),
+                    _row("2601.00002", "2026-01-03T00:00:00Z", "cs.LG"),
+                ]
+            ),
+        }
+        def fake_fetch(categories=None, max_results=None, **kwargs):
+            # The merge is only correct over published-descending inputs
+            assert kwargs.get("sort_by") == "submittedDate"
+            assert kwargs.get("sort_order") == "descending"
+            return by_category[categories[0]]
+
+        monkeypatch.setattr(fetcher, "fetch_papers", fake_fetch)
+
+        merged = fetcher.fetch_papers_per_category(
+            categories=["cs.AI", "cs.LG"], max_results=10
+        )
+
+        assert merged.arxiv_ids == ["2601.00001", "2601.00003", "2601.00002"]
+        assert merged.published == sorted(merged.published, reverse=True)
+    finally:
+        fetcher.close()
+
+
+def test_fetch_errors_are_not_memoized(monkeypatch, tmp_path):
+    """A failed fetch must not be served from the in-process memo: the next
+    identical call retries the network and gets the real result
+    (regression: lru_cache once pinned the empty error result)."""
+    monkeypatch.setenv("PAPERBIRD_CACHE_DIR", str(tmp_path))
+    fetcher = ArxivFetcher()
+    try:
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                raise requests.ConnectionError("network down")
+            return _FakeResponse(_FEED)
+
+        monkeypatch.setattr(fetcher._session, "get", fake_get)
+
+        assert len(fetcher.fetch_papers(search_query="cat:cs.AI")) == 0
+
+        papers = fetcher.fetch_papers(search_query="cat:cs.AI")
+        assert len(calls) == 2
+        assert papers.arxiv_ids == ["2601.00001v1"]
+    finally:
+        fetcher.close()
+
+
+def test_cached_results_are_defensively_copied(monkeypatch, tmp_path):
+    """Mutating a returned container must not corrupt future cached
+    responses (regression: the memo and 304 paths once handed every
+    caller the same live Papers instance)."""
+    monkeypatch.setenv("PAPERBIRD_CACHE_DIR", str(tmp_path))
+    fetcher = ArxivFetcher()
+    try:
+        monkeypatch.setattr(
+            fetcher._session, "get", lambda url, **kwargs: _FakeResponse(_FEED)
+        )
+
+        first = fetcher.fetch_papers(search_query="cat:cs.AI")
+        second = fetcher.fetch_papers(search_query="cat:cs.AI")
+        assert first is not second
+
+        first.append(**_row("2601.00099", "2026-01-06T00:00:00Z", "cs.AI"))
+        assert fetcher.fetch_papers(search_query="cat:cs.AI").arxiv_ids == [
+            "2601.00001v1"
+        ]
+    finally:
+        fetcher.close()